@@ -1,99 +1,238 @@
+from __future__ import annotations
+
 import argparse
 import configparser
-from datetime import datetime
-import grp,pwd
-from fnmatch import fnmatch
-import hashlib
-from math import ceil
+from dataclasses import dataclass
+import functools
 import os
-import re
+import stat
 import sys
-import zlib
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, TypeVar
 
 
-# argparse is a Python module used to handle command line arguments,
-# here we create a parser object with a description "Git clone"
-argparser = argparse.ArgumentParser(description="Git clone")
+@functools.cache
+def _get_parser() -> argparse.ArgumentParser:
+    """
+    Builds the command line parser on first use and reuses it afterwards,
+    so importing libwyag as a library never pays for argparse setup.
+    """
+    # argparse is a Python module used to handle command line arguments,
+    # here we create a parser object with a description "Git clone"
+    argparser = argparse.ArgumentParser(description="Git clone")
+
+    # Subparsers allow us to create multiple commands, like 'init', 'add', etc.
+    # Here we define that the program expects commands, and the chosen command
+    # will be saved in args.command.
+    argsubparsers = argparser.add_subparsers(title="Commands", dest="command")
+    argsubparsers.required = True  # Makes it mandatory to provide a command
+
+    # Adding the 'init' command to the argument parser, with help message
+    argsp = argsubparsers.add_parser("init", help="Initialize a new, empty repository.")
+    argsp.add_argument("path",                               # 'path' argument is optional, default '.'
+                       metavar="directory",
+                       nargs="?",
+                       default=".",
+                       help="Where to create the repository.")
+
+    return argparser
+
+
+# Parsed .git/config files, one entry per absolute path. Each entry remembers
+# the file's (st_dev, st_ino, st_size, st_mtime_ns) and is replaced as soon
+# as a stat of the file no longer matches, so an edited config is re-read.
+_CONFIG_CACHE: dict[str, tuple[tuple[int, int, int, int], _CachedConfig]] = {}
+
+# Marks "no fallback given" in GitConfig.get, since None is a valid fallback
+_UNSET: Any = object()
+
+def main(argv: list[str] = sys.argv[1:]) -> None:
+    # Fast path: plain "init [directory]" needs no real parsing, so skip argparse.
+    # Anything with options (e.g. --help) still goes through the full parser.
+    if argv and argv[0] == "init" and len(argv) <= 2 \
+            and not any(a.startswith("-") for a in argv[1:]):
+        args = argparse.Namespace(command="init", path=argv[1] if len(argv) > 1 else ".")
+    else:
+        # Parse the command line arguments from argv (default: from sys.argv)
+        args = _get_parser().parse_args(argv)
+    
+    # Look up the handler for the chosen command in the _COMMANDS table
+    _COMMANDS.get(args.command, _bad_command)(args)
 
-# Subparsers allow us to create multiple commands, like 'init', 'add', etc.
-# Here we define that the program expects commands, and the chosen command
-# will be saved in args.command.
-argsubparsers = argparser.add_subparsers(title="Commands", dest="command")
-argsubparsers.required = True  # Makes it mandatory to provide a command
 
-def main(argv=sys.argv[1:]):
-    # Parse the command line arguments from argv (default: from sys.argv)
-    args = argparser.parse_args(argv)
-    
-    # Python 3.10+ 'match' statement to call different functions based on command
-    match args.command:
-        case "add"          : cmd_add(args)          # Add files to staging
-        case "cat-file"     : cmd_cat_file(args)     # Display contents of an object
-        case "check-ignore" : cmd_check_ignore(args) # Check if files are ignored
-        case "checkout"     : cmd_checkout(args)     # Switch branches or restore files
-        case "commit"       : cmd_commit(args)       # Commit staged files
-        case "hash-object"  : cmd_hash_object(args)  # Hash file contents
-        case "init"         : cmd_init(args)          # Initialize a new repo (implemented here)
-        case "log"          : cmd_log(args)           # Show commit logs
-        case "ls-files"     : cmd_ls_files(args)      # List files in the index
-        case "ls-tree"      : cmd_ls_tree(args)       # Show tree objects
-        case "rev-parse"    : cmd_rev_parse(args)     # Parse revision references
-        case "rm"           : cmd_rm(args)             # Remove files
-        case "show-ref"     : cmd_show_ref(args)      # Show refs (branches, tags)
-        case "status"       : cmd_status(args)        # Show repository status
-        case "tag"          : cmd_tag(args)           # Manage tags
-        case _              : print("Bad argument passed!") # Unknown command
+def _bad_command(args: argparse.Namespace) -> None:
+    print("Bad argument passed!") # Unknown command
 
 
 class GitRepository(object):
     """Class representing a Git repository on disk"""
     
-    worktree = None     # The root directory of the working tree (your project)
-    gitdir = None       # The path to the '.git' directory containing git metadata
-    conf = None         # Configuration parser object for .git/config file
+    # Fixed attribute set: no per-instance __dict__, faster attribute access
+    __slots__ = ("worktree", "gitdir", "conf", "_gitdir_sep")
+
+    worktree: str       # The root directory of the working tree (your project)
+    gitdir: str         # The path to the '.git' directory containing git metadata
+    conf: GitConfig     # GitConfig holding the settings from the .git/config file
+    _gitdir_sep: str    # gitdir plus a trailing separator, used by repo_path
     
-    def __init__(self,path,force=False):
+    def __init__(self, path: str, force: bool = False) -> None:
         # Initialize GitRepository with the path to working tree
         self.worktree = path
         
         # Set path to the .git directory inside the working tree
         self.gitdir = os.path.join(path, ".git")
+        self._gitdir_sep = self.gitdir + os.sep   # Prefix reused by repo_path
         
         # If not forcing, check if the .git directory exists and is a directory
         if not (force or os.path.isdir(self.gitdir)):
             # If not valid .git directory, raise an exception
             raise Exception(f"Not a Git repository {path}")
 
-        # Create a ConfigParser object to read configuration settings
-        self.conf = configparser.ConfigParser()
-        
-        # Get the path to the config file inside the .git directory
-        cf = repo_file(self, "config")
-
-        if cf and os.path.exists(cf):
-            # If the config file exists, read it into the ConfigParser
-            self.conf.read([cf])
+        # Get the path to the config file inside the .git directory. .git was
+        # just checked (or we're forcing), so skip repo_file's directory check;
+        # the stat below covers a missing .git as well as a missing config.
+        cf = repo_path(self, "config")
+
+        try:
+            st: os.stat_result | None = os.stat(cf)
+        except (FileNotFoundError, NotADirectoryError):
+            st = None
+
+        if st is not None:
+            # Reuse the parsed config if the file hasn't changed since last read
+            key = os.path.abspath(cf)
+            sig = (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+            entry = _CONFIG_CACHE.get(key)
+            if entry is not None and entry[0] == sig:
+                cached = entry[1]
+            else:
+                cached = _read_config(cf)
+                _CONFIG_CACHE[key] = (sig, cached)
+            self.conf, vers = cached.conf, cached.version
         elif not force:
             # If config file missing and not forcing, raise an exception
             raise Exception("Configuration file missing")
+        else:
+            # Forced creation without a config file: start from an empty one
+            self.conf, vers = GitConfig(), None
 
         if not force:
             # Check if the repository format version in the config is 0 (expected for now)
-            vers = int(self.conf.get("core", "repositoryformatversion"))
+            if vers is None:
+                # Not set at all, which is a different problem from a bad value
+                raise Exception("Configuration file missing core.repositoryformatversion")
             if vers != 0:
                 # If version unsupported, raise exception
-                raise Exception("Unsupported repositoryformatversion: {vers}")
+                raise Exception(f"Unsupported repositoryformatversion: {vers}")
 
 
-def repo_path(repo, *path):
+class GitConfig(object):
+    """
+    Minimal read-only view of a parsed .git/config file.
+    Exposes the ConfigParser-style sections(), items() and get() used by callers.
+    Instances are shared through _CONFIG_CACHE, so nothing in them can be
+    changed: sections and their options are read-only mappings.
+    """
+
+    __slots__ = ("_sections",)
+
+    _sections: Mapping[str, Mapping[str, str]]
+
+    def __init__(self, sections: dict[str, dict[str, str]] | None = None) -> None:
+        object.__setattr__(self, "_sections",
+                           MappingProxyType({name: MappingProxyType(dict(options))
+                                             for name, options in (sections or {}).items()}))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"GitConfig is read-only, cannot set {name!r}")
+
+    def sections(self) -> list[str]:
+        return list(self._sections)
+
+    def items(self, section: str) -> list[tuple[str, str]]:
+        try:
+            return list(self._sections[section].items())
+        except KeyError:
+            raise configparser.NoSectionError(section)
+
+    def get(self, section: str, option: str, fallback: Any = _UNSET) -> Any:
+        try:
+            return self._sections[section][option.lower()]
+        except KeyError:
+            if fallback is not _UNSET:
+                return fallback
+            if section not in self._sections:
+                raise configparser.NoSectionError(section)
+            raise configparser.NoOptionError(option, section)
+
+
+def _parse_git_config(cf: str) -> dict[str, dict[str, str]]:
+    """
+    Parses the config file at cf into {section: {option: value}}.
+    Git's config grammar is simple enough that a plain line scan is
+    much cheaper than going through ConfigParser.
+    """
+    with open(cf, "rb") as f:
+        lines = f.read().split(b"\n")
+
+    sections: dict[str, dict[str, str]] = {}
+    current: dict[str, str] | None = None
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith((b"#", b";")):      # Skip blanks and comments
+            continue
+        if line.startswith(b"[") and line.endswith(b"]"):  # [section] header
+            current = sections.setdefault(line[1:-1].strip().decode(), {})
+            continue
+        if current is None:                                # Option before any section
+            continue
+        key, eq, value = line.partition(b"=")
+        # A bare key with no '=' is git's shorthand for "true"
+        current[key.strip().decode().lower()] = value.strip().decode() if eq else "true"
+
+    return sections
+
+
+@dataclass(frozen=True)
+class _CachedConfig:
+    """A parsed config file together with its already-converted format version."""
+
+    conf: GitConfig
+    # core.repositoryformatversion: an int when it parses as one, otherwise
+    # the raw string (rejected later unless forcing), None if unset
+    version: int | str | None
+
+
+def _read_config(cf: str) -> _CachedConfig:
+    """
+    Parses the config file at cf, converting core.repositoryformatversion
+    to an int once so repository construction never has to. A value that
+    isn't an integer is kept as-is rather than raising here, so that
+    GitRepository(..., force=True) never has to look at it.
+    """
+    conf = GitConfig(_parse_git_config(cf))
+    vers: int | str | None = conf.get("core", "repositoryformatversion", fallback=None)
+    if vers is not None:
+        try:
+            vers = int(vers)
+        except ValueError:
+            pass
+    return _CachedConfig(conf, vers)
+
+
+def repo_path(repo: GitRepository, *path: str) -> str:
     """
     Returns the path inside the .git directory by joining multiple parts.
     For example, repo_path(repo, "refs", "heads", "master") returns
     '.git/refs/heads/master'
     """
-    return os.path.join(repo.gitdir, *path)
+    # Parts are always relative names inside .git, so plain string joining
+    # onto the cached prefix gives the same result as os.path.join
+    if path:
+        return repo._gitdir_sep + os.sep.join(path)
+    return repo.gitdir
 
-def repo_file(repo, *path, mkdir=False):
+def repo_file(repo: GitRepository, *path: str, mkdir: bool = False) -> str | None:
     """
     Similar to repo_path but ensures the parent directory exists.
     If mkdir=True, it creates the parent directories if they don't exist.
@@ -101,30 +240,34 @@ def repo_file(repo, *path, mkdir=False):
     """
     if repo_dir(repo, *path[:-1], mkdir=mkdir):   # Create parent directory if needed
         return repo_path(repo, *path)              # Return full path to the file
+    return None
 
-def repo_dir(repo, *path, mkdir=False):
+def repo_dir(repo: GitRepository, *path: str, mkdir: bool = False) -> str | None:
     """
     Similar to repo_path but works for directories.
     Checks if the directory exists. If not and mkdir=True, creates it.
     Returns the directory path or None.
     """
-    path = repo_path(repo, *path)
-
-    if os.path.exists(path):
-        if (os.path.isdir(path)):
-            return path    # Directory exists, return path
+    full = repo_path(repo, *path)
+
+    # A single stat() tells us both whether the path exists and what it is
+    try:
+        st = os.stat(full)
+    except (FileNotFoundError, NotADirectoryError):
+        if mkdir:
+            os.makedirs(full)  # Create the directory and any missing parents
+            return full
         else:
-            # Path exists but it's a file, not a directory
-            raise Exception(f"Not a directory {path}")
+            return None        # Directory does not exist, and mkdir is False
 
-    if mkdir:
-        os.makedirs(path)  # Create the directory and any missing parents
-        return path
+    if stat.S_ISDIR(st.st_mode):
+        return full    # Directory exists, return path
     else:
-        return None        # Directory does not exist, and mkdir is False
+        # Path exists but it's a file, not a directory
+        raise Exception(f"Not a directory {full}")
 
 
-def repo_create(path):
+def repo_create(path: str) -> GitRepository:
     """
     Creates a new Git repository at the given path.
     It sets up the .git directory structure and default files.
@@ -133,84 +276,201 @@ def repo_create(path):
     repo = GitRepository(path, True)
 
     # Check if the working directory exists
-    if os.path.exists(repo.worktree):
-        if not os.path.isdir(repo.worktree):
+    try:
+        st = os.stat(repo.worktree)
+    except FileNotFoundError:
+        # If the worktree directory doesn't exist, create it
+        os.makedirs(repo.worktree)
+    else:
+        if not stat.S_ISDIR(st.st_mode):
             # If it exists but is not a directory, error out
             raise Exception(f"{path} is not a directory!")
         # If .git directory exists and is not empty, it's already a repo
-        if os.path.exists(repo.gitdir) and os.listdir(repo.gitdir):
+        if _dir_nonempty(repo.gitdir):
             raise Exception(f"{path} is already a git repository!")
-    else:
-        # If the worktree directory doesn't exist, create it
-        os.makedirs(repo.worktree)
 
-    # Create required directories inside .git (branches, objects, refs/tags, refs/heads)
-    assert repo_dir(repo, "branches", mkdir=True)
-    assert repo_dir(repo, "objects", mkdir=True)
-    assert repo_dir(repo, "refs", "tags", mkdir=True)
-    assert repo_dir(repo, "refs", "heads", mkdir=True)
+    # The new .git may change which repository repo_find picks for any directory
+    _repo_find_forget()
+
+    # Create required directories inside .git (branches, objects, refs/tags, refs/heads).
+    # makedirs creates .git itself along the way, so no per-file checks are needed below.
+    for sub in ("branches", "objects", os.path.join("refs", "tags"), os.path.join("refs", "heads")):
+        os.makedirs(os.path.join(repo.gitdir, sub), exist_ok=True)
 
     # Create a description file with a default message
-    with open(repo_file(repo, "description", mkdir=True), "w") as f:
-        f.write("Unnamed repository; edit this file 'description' to name the repository.\n")
+    _write_file(os.path.join(repo.gitdir, "description"),
+                b"Unnamed repository; edit this file 'description' to name the repository.\n")
 
     # Create the HEAD file which points to the master branch by default
-    with open(repo_file(repo, "HEAD", mkdir=True), "w") as f:
-        f.write("ref: refs/heads/master\n")
+    _write_file(os.path.join(repo.gitdir, "HEAD"), b"ref: refs/heads/master\n")
 
     # Create the config file with default configuration options
-    with open(repo_file(repo, "config", mkdir=True), "w") as f:
-        config = repo_default_config()
-        config.write(f)
+    _write_file(os.path.join(repo.gitdir, "config"), _DEFAULT_CONFIG_BYTES)
 
     return repo   # Return the newly created GitRepository object
 
 
-def repo_default_config():
+def _dir_nonempty(path: str) -> bool:
+    """
+    Returns True if path is a directory with at least one entry. Stops at
+    the first entry instead of listing the whole directory. Raises if path
+    exists but isn't a directory (e.g. a .git file from a worktree).
+    """
+    try:
+        with os.scandir(path) as it:
+            return next(it, None) is not None
+    except FileNotFoundError:
+        return False
+    except NotADirectoryError:
+        # Path exists but it's a file, not a directory
+        raise Exception(f"Not a directory {path}")
+
+
+def _write_file(path: str, data: bytes) -> None:
+    """
+    Writes the bytes in data to path (creating or truncating it) with
+    a single write() call in the common case.
+    """
+    # 0o666 filtered by the umask, same as open(path, "w")
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]   # Retry on a short write
+    finally:
+        os.close(fd)
+
+
+# Default .git/config contents, exactly as ConfigParser.write would produce them
+_DEFAULT_CONFIG_BYTES = (b"[core]\n"
+                         b"repositoryformatversion = 0\n"   # Set repo format version to 0
+                         b"filemode = false\n"              # Don't track file mode changes
+                         b"bare = false\n"                  # Repository is non-bare (has working tree)
+                         b"\n")
+
+
+def repo_default_config() -> configparser.ConfigParser:
     """
     Returns a ConfigParser object with default Git configuration settings.
     These settings are basic config options needed by Git.
     """
     ret = configparser.ConfigParser()
+    ret.read_string(_DEFAULT_CONFIG_BYTES.decode())
+    return ret
 
-    ret.add_section("core")                              # Add 'core' section in config
-    ret.set("core", "repositoryformatversion", "0")     # Set repo format version to 0
-    ret.set("core", "filemode", "false")                 # Don't track file mode changes
-    ret.set("core", "bare", "false")                      # Repository is non-bare (has working tree)
 
-    return ret
+# repo_find results per directory: _REPO_FIND_POSITIVE maps a directory to
+# the worktree root of the repository that contains it, _REPO_FIND_NEGATIVE
+# holds directories known to have no repository above them. Both are
+# LRU-ordered dicts capped at _REPO_FIND_CACHE_SIZE entries (the negative one
+# only uses its keys). Entries are re-checked against the disk on every hit,
+# since another process may create or remove a .git at any time.
+_REPO_FIND_CACHE_SIZE = 512
+_REPO_FIND_POSITIVE: dict[str, str] = {}
+_REPO_FIND_NEGATIVE: dict[str, None] = {}
 
 
-# Adding the 'init' command to the argument parser, with help message
-argsp = argsubparsers.add_parser("init", help="Initialize a new, empty repository.")
-argsp.add_argument("path",                               # 'path' argument is optional, default '.'
-                   metavar="directory",
-                   nargs="?",
-                   default=".",
-                   help="Where to create the repository.")
-                   
-def repo_find(path=".", required=True):
+def _repo_find_remember(cache: dict[str, Any], key: str, value: Any = None) -> None:
     """
-    Find a Git repository by looking for the .git directory starting
-    at the given path and moving up parent directories recursively.
-    If required=True and repo not found, raises an exception.
+    Stores key in one of the repo_find caches as the most recently used
+    entry, evicting the least recently used one when the cache is full.
     """
-    path = os.path.realpath(path)                 # Convert to absolute path
+    cache.pop(key, None)
+    cache[key] = value
+    if len(cache) > _REPO_FIND_CACHE_SIZE:
+        del cache[next(iter(cache))]
 
-    if os.path.isdir(os.path.join(path, ".git")): # If .git directory exists here, return GitRepository
-        return GitRepository(path)
 
-    # Otherwise, try searching the parent directory
-    parent = os.path.realpath(os.path.join(path, ".."))
+def _repo_find_forget() -> None:
+    """
+    Drops every cached repo_find result. Called whenever a repository is
+    created, since a new .git can change the answer for any directory.
+    """
+    _REPO_FIND_POSITIVE.clear()
+    _REPO_FIND_NEGATIVE.clear()
 
-    if parent == path:                             # If we reached the root directory without finding .git
-        if required:
-            raise Exception("No git directory.")  # Raise error if repo is required
-        else:
-            return None                            # Otherwise, return None
 
-    # Recursive call to check parent directory
-    return repo_find(parent, required)
+def _has_gitdir(path: str) -> bool:
+    """Returns True if path contains a .git directory."""
+    try:
+        return stat.S_ISDIR(os.stat(os.path.join(path, ".git")).st_mode)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
+
+def _repo_find_still_valid(path: str, root: str | None) -> bool:
+    """
+    Checks a cached repo_find answer for path against the disk: no directory
+    from path up to root (or up to the filesystem root when root is None)
+    may have gained a .git, and root itself must still have one.
+    """
+    while path != root:
+        if _has_gitdir(path):
+            return False
+        parent = os.path.dirname(path)
+        if parent == path:                         # Reached the filesystem root
+            return root is None
+        path = parent
+    return _has_gitdir(path)
+
+
+def repo_find(path: str = ".", required: bool = True) -> GitRepository | None:
+    """
+    Find a Git repository by looking for the .git directory starting
+    at the given path and moving up parent directories one at a time.
+    If required=True and repo not found, raises an exception.
+    """
+    path = os.path.realpath(path)                 # Convert to absolute path, once
+    walked: list[str] = []                        # Directories checked so far
+    root: str | None = None                       # Worktree root, once found
+
+    while True:
+        # Answer from the caches if this directory has been seen before and
+        # the answer still holds; a stale entry is dropped and the walk goes on
+        if path in _REPO_FIND_POSITIVE:
+            if _repo_find_still_valid(path, _REPO_FIND_POSITIVE[path]):
+                root = _REPO_FIND_POSITIVE[path]
+                break
+            del _REPO_FIND_POSITIVE[path]
+        elif path in _REPO_FIND_NEGATIVE:
+            if _repo_find_still_valid(path, None):
+                break
+            del _REPO_FIND_NEGATIVE[path]
+
+        walked.append(path)
+
+        # If .git directory exists here, this is the worktree root
+        if _has_gitdir(path):
+            root = path
+            break
+
+        # Otherwise, move on to the parent directory. path is already
+        # canonical, so dirname() is enough to step up.
+        parent = os.path.dirname(path)
+
+        if parent == path:                         # If we reached the root directory without finding .git
+            break
+
+        path = parent
+
+    # Every directory walked on the way shares the same answer
+    if root is not None:
+        # Only the root is cached, not the GitRepository: constructing it
+        # again re-checks the config, which the config cache keeps cheap
+        repo = GitRepository(root)
+        for p in walked:
+            _repo_find_remember(_REPO_FIND_POSITIVE, p, root)
+        _repo_find_remember(_REPO_FIND_POSITIVE, path, root)
+        return repo
+
+    for p in walked:
+        _repo_find_remember(_REPO_FIND_NEGATIVE, p)
+    _repo_find_remember(_REPO_FIND_NEGATIVE, path)
+
+    if required:
+        raise Exception("No git directory.")  # Raise error if repo is required
+    else:
+        return None                            # Otherwise, return None
 
 
 """
@@ -223,28 +483,43 @@ def repo_find(path=".", required=True):
     whose paths are determined by their contents.
 """
 
+# The concrete GitObject subclass a constructor was called on
+_T = TypeVar("_T", bound="GitObject")
+
+
 class GitObject(object):
 
-    def __init__(self, data=None):
-        if data!=None:
-            self.deserialize(data)
-        else:
-            self.init()
+    __slots__ = ()   # No per-instance __dict__ on the base class
+
+    # Two constructors instead of one __init__(data=None), so the choice
+    # between deserialize() and init() is made by the caller, not per object
+
+    @classmethod
+    def from_data(cls: type[_T], data: bytes) -> _T:
+        obj = cls()
+        obj.deserialize(data)
+        return obj
+
+    @classmethod
+    def empty(cls: type[_T]) -> _T:
+        obj = cls()
+        obj.init()
+        return obj
 
-    def serialize(self, repo):
+    def serialize(self, repo: GitRepository) -> bytes:
         # implement in subclass
         
         raise Exception("Unimplemented")
 
-    def deserialize(self, data):
+    def deserialize(self, data: bytes) -> None:
         raise Exception("Unimplementeda")
 
-    def init(self):
+    def init(self) -> None:
         pass
 
 
 
-def cmd_init(args):
+def cmd_init(args: argparse.Namespace) -> None:
     """
     Command handler for 'git init' command.
     Calls repo_create to create a new repository at the given path.
@@ -252,3 +527,10 @@ def cmd_init(args):
     repo_create(args.path)
 
 
+# Maps each command name to its handler. Built once at import time, after
+# every cmd_* function is defined; add new commands here as they get implemented
+# (add, cat-file, check-ignore, checkout, commit, hash-object, log, ls-files,
+# ls-tree, rev-parse, rm, show-ref, status, tag).
+_COMMANDS: dict[str, Callable[[argparse.Namespace], None]] = {
+    "init" : cmd_init,          # Initialize a new repo
+}
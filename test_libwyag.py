@@ -0,0 +1,213 @@
+import configparser
+import os
+import shutil
+
+import pytest
+
+import libwyag
+
+
+def parse(tmp_path, data):
+    cf = tmp_path / "config"
+    cf.write_bytes(data)
+    return libwyag.GitConfig(libwyag._parse_git_config(str(cf)))
+
+
+def test_default_config_round_trip(tmp_path):
+    conf = parse(tmp_path, libwyag._DEFAULT_CONFIG_BYTES)
+
+    # Same view of the default config as ConfigParser gives
+    expected = libwyag.repo_default_config()
+    assert conf.sections() == expected.sections()
+    assert conf.items("core") == expected.items("core")
+    assert conf.get("core", "repositoryformatversion") == "0"
+    assert conf.get("core", "filemode") == "false"
+    assert conf.get("core", "bare") == "false"
+
+
+def test_comments_blanks_and_bare_keys(tmp_path):
+    conf = parse(tmp_path, b"# leading comment\n"
+                           b"\n"
+                           b"[core]\n"
+                           b"\t; indented comment\n"
+                           b"\tBare = false\n"
+                           b"\tlogallrefupdates\n"
+                           b"[remote \"origin\"]\n"
+                           b"\turl = https://example.com/a=b\n")
+
+    assert conf.sections() == ["core", "remote \"origin\""]
+    assert conf.items("core") == [("bare", "false"), ("logallrefupdates", "true")]
+    assert conf.items("remote \"origin\"") == [("url", "https://example.com/a=b")]
+    # Option names are case-insensitive, like ConfigParser
+    assert conf.get("core", "BARE") == "false"
+
+
+def test_repeated_option_last_wins(tmp_path):
+    # Unlike ConfigParser (which raises), a repeated option keeps the last
+    # value, as git does for single-valued settings
+    conf = parse(tmp_path, b"[core]\nbare = true\n[core]\nbare = false\n")
+
+    assert conf.get("core", "bare") == "false"
+
+
+def test_missing_section_or_option(tmp_path):
+    conf = parse(tmp_path, libwyag._DEFAULT_CONFIG_BYTES)
+
+    with pytest.raises(configparser.NoSectionError):
+        conf.get("user", "name")
+    with pytest.raises(configparser.NoOptionError):
+        conf.get("core", "editor")
+
+    assert conf.get("user", "name", fallback=None) is None
+    assert conf.get("core", "editor", fallback="vi") == "vi"
+
+    with pytest.raises(configparser.NoSectionError):
+        conf.items("user")
+
+
+def set_version(repo, version, like=None):
+    # Rewrite repo's config with a new format version; with like, also copy
+    # that file's mtime so only the path tells the two configs apart
+    cf = os.path.join(repo.gitdir, "config")
+    with open(cf, "wb") as f:
+        f.write(libwyag._DEFAULT_CONFIG_BYTES.replace(b"= 0", b"= " + version))
+    if like is not None:
+        st = os.stat(os.path.join(like.gitdir, "config"))
+        os.utime(cf, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def test_config_cache_keys_on_absolute_path(tmp_path, monkeypatch):
+    a = libwyag.repo_create(str(tmp_path / "a"))
+    b = libwyag.repo_create(str(tmp_path / "b"))
+    set_version(b, b"1", like=a)
+
+    # Both repositories are opened as ".", so their config path is the same
+    # relative string
+    monkeypatch.chdir(a.worktree)
+    libwyag.GitRepository(".")
+    monkeypatch.chdir(b.worktree)
+    with pytest.raises(Exception, match="Unsupported repositoryformatversion: 1"):
+        libwyag.GitRepository(".")
+
+
+def test_config_cache_rereads_edited_config(tmp_path):
+    repo = libwyag.repo_create(str(tmp_path / "r"))
+    libwyag.GitRepository(repo.worktree)
+
+    set_version(repo, b"5")
+    with pytest.raises(Exception, match="Unsupported repositoryformatversion: 5"):
+        libwyag.GitRepository(repo.worktree)
+
+
+def test_cached_config_is_read_only(tmp_path):
+    repo = libwyag.repo_create(str(tmp_path / "r"))
+    a = libwyag.GitRepository(repo.worktree)
+    b = libwyag.GitRepository(repo.worktree)
+
+    with pytest.raises(TypeError):
+        a.conf._sections["core"]["bare"] = "true"
+    with pytest.raises(AttributeError):
+        a.conf._sections = {}
+    assert b.conf.get("core", "bare") == "false"
+
+
+@pytest.fixture
+def fresh_find_cache():
+    libwyag._repo_find_forget()
+    yield
+    libwyag._repo_find_forget()
+
+
+def external_init(path):
+    # Create a repository the way another process would, without going
+    # through repo_create (which clears the repo_find caches)
+    os.makedirs(os.path.join(path, ".git"))
+    with open(os.path.join(path, ".git", "config"), "wb") as f:
+        f.write(libwyag._DEFAULT_CONFIG_BYTES)
+
+
+def test_repo_find_caches_hit_after_walk(tmp_path, fresh_find_cache):
+    top = libwyag.repo_create(str(tmp_path / "top")).worktree
+    sub = os.path.join(top, "a", "b")
+    os.makedirs(sub)
+
+    assert libwyag.repo_find(sub).worktree == top
+    assert libwyag._REPO_FIND_POSITIVE == {
+        sub: top, os.path.dirname(sub): top, top: top,
+    }
+    assert libwyag.repo_find(sub).worktree == top
+
+
+def test_repo_find_cached_hit_sees_nested_repository(tmp_path, fresh_find_cache):
+    top = libwyag.repo_create(str(tmp_path / "top")).worktree
+    sub = os.path.join(top, "a", "b")
+    os.makedirs(sub)
+    libwyag.repo_find(sub)
+
+    external_init(sub)
+    assert libwyag.repo_find(sub).worktree == sub
+
+
+def test_repo_find_cached_hit_with_removed_repository(tmp_path, fresh_find_cache):
+    top = libwyag.repo_create(str(tmp_path / "top")).worktree
+    libwyag.repo_find(top)
+
+    shutil.rmtree(os.path.join(top, ".git"))
+    assert libwyag.repo_find(top, required=False) is None
+    assert top not in libwyag._REPO_FIND_POSITIVE
+
+
+def test_repo_find_caches_miss(tmp_path, fresh_find_cache):
+    d = str(tmp_path / "d")
+    os.makedirs(d)
+
+    assert libwyag.repo_find(d, required=False) is None
+    assert d in libwyag._REPO_FIND_NEGATIVE
+    assert libwyag.repo_find(d, required=False) is None
+
+    # A repository created behind the cache's back is still found
+    external_init(d)
+    assert libwyag.repo_find(d).worktree == d
+
+
+def test_repo_create_clears_find_caches(tmp_path, fresh_find_cache):
+    top = libwyag.repo_create(str(tmp_path / "top")).worktree
+    libwyag.repo_find(top)
+    libwyag.repo_find(str(tmp_path), required=False)
+    assert libwyag._REPO_FIND_POSITIVE and libwyag._REPO_FIND_NEGATIVE
+
+    libwyag.repo_create(str(tmp_path / "other"))
+    assert not libwyag._REPO_FIND_POSITIVE
+    assert not libwyag._REPO_FIND_NEGATIVE
+
+
+def test_repo_find_cache_evicts_least_recently_used(monkeypatch, fresh_find_cache):
+    monkeypatch.setattr(libwyag, "_REPO_FIND_CACHE_SIZE", 2)
+    cache = libwyag._REPO_FIND_NEGATIVE
+
+    libwyag._repo_find_remember(cache, "/a")
+    libwyag._repo_find_remember(cache, "/b")
+    libwyag._repo_find_remember(cache, "/a")       # /a is now the most recent
+    libwyag._repo_find_remember(cache, "/c")
+
+    assert list(cache) == ["/a", "/c"]
+
+
+def test_repo_create_over_git_file(tmp_path):
+    # A worktree or submodule checkout has a .git *file*
+    (tmp_path / ".git").write_text("gitdir: ../elsewhere\n")
+
+    with pytest.raises(Exception, match="Not a directory .*\\.git") as e:
+        libwyag.repo_create(str(tmp_path))
+    assert type(e.value) is Exception          # Not a raw NotADirectoryError
+
+
+def test_missing_format_version(tmp_path):
+    repo = libwyag.repo_create(str(tmp_path / "r"))
+    with open(os.path.join(repo.gitdir, "config"), "wb") as f:
+        f.write(b"[core]\nbare = false\n")
+
+    with pytest.raises(Exception, match="missing core.repositoryformatversion"):
+        libwyag.GitRepository(repo.worktree)
+    # Forcing skips the check, as it always has
+    libwyag.GitRepository(repo.worktree, force=True)